@@ -0,0 +1,133 @@
+"""
+Delta reporting between two QA runs
+Joins the current run against a baseline (previous workbook or cached snapshot)
+"""
+
+import json
+import os
+from jinja2 import Template
+
+COMPARE_TEMPLATE_FILE = 'compare_template.html'
+SNAPSHOT_FILE = 'snapshot.json'
+
+def index_by(rows, key):
+    """Build a hash index over a list of row dicts; duplicate keys raise ValueError"""
+    index = {}
+    for row in rows:
+        if row[key] in index:
+            raise ValueError(f"Duplicate {key} {row[key]!r}: rows cannot be matched between runs")
+        index[row[key]] = row
+    return index
+
+def save_snapshot(run_data, path):
+    """Cache the parsed data of a run so it can be used as a later baseline"""
+    with open(path, 'w') as f:
+        json.dump(run_data, f, indent=2, default=str)
+    return path
+
+def load_snapshot(path):
+    """Load a cached snapshot written by save_snapshot"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _change(after, before):
+    """Signed difference, or None when either side is missing"""
+    if after is None or before is None:
+        return None
+    return after - before
+
+def compute_delta(current, baseline):
+    """Compare two read_excel_data results using hash joins"""
+    # Suites joined by name
+    baseline_suites = index_by(baseline['summary_data'], 'name')
+    current_suites = index_by(current['summary_data'], 'name')
+
+    suites = []
+    for suite in current['summary_data']:
+        before = baseline_suites.get(suite['name'])
+        change = _change(suite['pass_rate'], before['pass_rate']) if before else None
+        if before is None:
+            state = 'new'
+        elif change == 0:
+            state = 'unchanged'
+        else:
+            state = 'changed'
+        suites.append({
+            'name': suite['name'],
+            'before': before['pass_rate'] if before else None,
+            'after': suite['pass_rate'],
+            'change': change,
+            'state': state,
+        })
+    for suite in baseline['summary_data']:
+        if suite['name'] not in current_suites:
+            suites.append({
+                'name': suite['name'],
+                'before': suite['pass_rate'],
+                'after': None,
+                'change': None,
+                'state': 'removed',
+            })
+
+    # Risks joined by issue id
+    baseline_risks = index_by(baseline['risks_data'], 'id')
+    current_risks = index_by(current['risks_data'], 'id')
+    new_risks = [r for r in current['risks_data'] if r['id'] not in baseline_risks]
+    resolved_risks = [r for r in baseline['risks_data'] if r['id'] not in current_risks]
+    open_risks = [r for r in current['risks_data'] if r['id'] in baseline_risks]
+
+    # Defects joined by priority
+    defects = []
+    priorities = list(current['defects']) + [p for p in baseline['defects'] if p not in current['defects']]
+    for priority in priorities:
+        before = baseline['defects'].get(priority, 0)
+        after = current['defects'].get(priority, 0)
+        defects.append({
+            'priority': priority,
+            'before': before,
+            'after': after,
+            'change': after - before,
+        })
+
+    return {
+        'suites': suites,
+        'new_risks': new_risks,
+        'resolved_risks': resolved_risks,
+        'open_risks': open_risks,
+        'defects': defects,
+        'overall': {
+            'before': baseline['overall_pass_rate'],
+            'after': current['overall_pass_rate'],
+            'change': current['overall_pass_rate'] - baseline['overall_pass_rate'],
+        },
+        'totals': {
+            key: {
+                'before': baseline[key],
+                'after': current[key],
+                'change': current[key] - baseline[key],
+            }
+            for key in ['total_tests', 'total_passed', 'total_failed', 'total_blocked']
+        },
+    }
+
+def render_delta_report(delta, report_title, baseline_label):
+    """Render a delta report to HTML"""
+    with open(COMPARE_TEMPLATE_FILE, 'r') as f:
+        template = Template(f.read())
+
+    return template.render(
+        report_title=report_title,
+        baseline_label=baseline_label,
+        delta=delta,
+    )
+
+def export_delta(html_content, report_type, output_dir):
+    """Export a delta report to HTML file"""
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    filename = f"{output_dir}/{report_type}_delta.html"
+    with open(filename, 'w') as f:
+        f.write(html_content)
+    print(f"  ✓ Delta: {filename}")
+    return filename
@@ -0,0 +1,201 @@
+"""
+Static PDF/PNG snapshots of the generated HTML reports
+Renders reports/*.html with a warm pool of headless Chromium pages (Playwright)
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import sys
+
+# Configuration
+REPORTS_DIR = 'reports'
+SNAPSHOT_DIR = 'reports/snapshots'
+SNAPSHOT_FORMATS = ('pdf', 'png')
+DEFAULT_CONCURRENCY = 4
+PAGE_WIDTH = 1280
+
+# Local copy of chart.js@3.9.1, served in place of the CDN script so charts
+# render without network access
+LOCAL_CHARTJS_FILE = 'vendor/chart.min.js'
+
+# Stop Chart.js animations so the snapshot shows the final chart state, and
+# report how many of the page's canvases actually hold a chart
+SETTLE_CHARTS_JS = """
+() => {
+    const canvases = document.querySelectorAll('canvas').length;
+    if (!window.Chart) {
+        return {canvases: canvases, charts: 0};
+    }
+    const charts = Object.values(Chart.instances);
+    charts.forEach(chart => { chart.stop(); chart.update('none'); });
+    return {canvases: canvases, charts: charts.length};
+}
+"""
+
+def _load_playwright():
+    """Import Playwright lazily so HTML generation never depends on it"""
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        raise RuntimeError(
+            "Snapshot export requires Playwright: "
+            "pip install playwright && python -m playwright install chromium"
+        )
+    return async_playwright
+
+def find_reports(reports_dir=REPORTS_DIR):
+    """List the finished HTML reports to export"""
+    return sorted(glob.glob(os.path.join(reports_dir, '*.html')))
+
+def _offline_router(chartjs_file):
+    """Serve everything from disk; block any request that would leave the machine"""
+    async def route_offline(route):
+        url = route.request.url
+        if url.startswith('file://'):
+            await route.continue_()
+        elif 'chart.js' in url:
+            await route.fulfill(path=chartjs_file, content_type='application/javascript')
+        else:
+            await route.abort()
+    return route_offline
+
+async def _render(page, html_path, formats, snapshot_dir):
+    """Render one report into every requested format, reusing an open page"""
+    await page.goto('file://' + os.path.abspath(html_path), wait_until='load')
+    charts = await page.evaluate(SETTLE_CHARTS_JS)
+    if charts['charts'] < charts['canvases']:
+        raise RuntimeError(
+            f"{html_path}: only {charts['charts']} of {charts['canvases']} charts rendered; "
+            "check that the local Chart.js is a valid chart.js@3.9.1 build"
+        )
+
+    stem = os.path.splitext(os.path.basename(html_path))[0]
+    written = []
+    if 'pdf' in formats:
+        path = os.path.join(snapshot_dir, f"{stem}.pdf")
+        await page.pdf(path=path, width=f"{PAGE_WIDTH}px", print_background=True)
+        written.append(path)
+    if 'png' in formats:
+        path = os.path.join(snapshot_dir, f"{stem}.png")
+        await page.screenshot(path=path, full_page=True)
+        written.append(path)
+    return written
+
+async def _export(html_files, formats, snapshot_dir, concurrency, chartjs_file, stats):
+    async_playwright = _load_playwright()
+
+    async with async_playwright() as p:
+        # One browser launch for the whole batch; pages are recycled through the pool
+        try:
+            browser = await p.chromium.launch()
+        except Exception as e:
+            raise RuntimeError(
+                f"Could not start headless Chromium ({str(e).splitlines()[0]}); "
+                "run: python -m playwright install chromium"
+            )
+        stats['browser_launches'] += 1
+        context = await browser.new_context(viewport={'width': PAGE_WIDTH, 'height': 1000})
+        await context.route('**/*', _offline_router(chartjs_file))
+
+        pool = asyncio.Queue()
+        for _ in range(min(concurrency, len(html_files))):
+            pool.put_nowait(await context.new_page())
+            stats['pages'] += 1
+
+        async def worker(html_path):
+            page = await pool.get()
+            try:
+                return await _render(page, html_path, formats, snapshot_dir)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                # Playwright errors (timeouts, crashed pages) are not RuntimeErrors
+                raise RuntimeError(f"{html_path}: {str(e).splitlines()[0]}") from e
+            finally:
+                pool.put_nowait(page)
+
+        tasks = [asyncio.create_task(worker(path)) for path in html_files]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Stop the remaining renders before their browser goes away
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await browser.close()
+
+    return [path for written in results for path in written]
+
+def export_snapshots(html_files=None, formats=SNAPSHOT_FORMATS, snapshot_dir=SNAPSHOT_DIR,
+                     concurrency=DEFAULT_CONCURRENCY, chartjs_file=LOCAL_CHARTJS_FILE, stats=None):
+    """Export HTML reports to static PDF/PNG snapshots
+
+    If a dict is passed as stats, it receives the number of browser launches
+    and pooled pages used for the batch.
+    """
+    stats = {} if stats is None else stats
+    stats.update(browser_launches=0, pages=0)
+    if html_files is None:
+        html_files = find_reports()
+    if not html_files:
+        return []
+
+    unknown = set(formats) - set(SNAPSHOT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unsupported snapshot format(s): {', '.join(sorted(unknown))}")
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+
+    # Without a local Chart.js every chart would be blank, so refuse instead
+    if not os.path.isfile(chartjs_file):
+        raise RuntimeError(
+            f"{chartjs_file} not found; snapshots are rendered offline and need a local "
+            "copy of chart.js@3.9.1 (chart.min.js) to draw charts"
+        )
+
+    if not os.path.exists(snapshot_dir):
+        os.makedirs(snapshot_dir)
+
+    written = asyncio.run(_export(html_files, formats, snapshot_dir, concurrency, chartjs_file, stats))
+    for path in written:
+        print(f"  ✓ Snapshot: {path}")
+    return written
+
+def parse_formats(value):
+    """Parse a comma-separated format list such as 'pdf,png'"""
+    formats = tuple(fmt.strip().lower() for fmt in value.split(',') if fmt.strip())
+    unknown = set(formats) - set(SNAPSHOT_FORMATS)
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(
+            f"unsupported snapshot format(s) '{value}' (choose from {', '.join(SNAPSHOT_FORMATS)})")
+    return formats
+
+def parse_concurrency(value):
+    """Parse the number of pages rendered in parallel"""
+    try:
+        concurrency = int(value)
+    except ValueError:
+        concurrency = 0
+    if concurrency < 1:
+        raise argparse.ArgumentTypeError(f"concurrency must be a whole number of at least 1, got '{value}'")
+    return concurrency
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export generated HTML reports to PDF/PNG snapshots")
+    parser.add_argument('reports', nargs='*', help="HTML reports to export (default: reports/*.html)")
+    parser.add_argument('--formats', type=parse_formats, default=SNAPSHOT_FORMATS,
+                        help="comma-separated list of formats (default: pdf,png)")
+    parser.add_argument('--concurrency', type=parse_concurrency, default=DEFAULT_CONCURRENCY,
+                        help="number of pages rendered in parallel")
+    args = parser.parse_args(argv)
+
+    try:
+        export_snapshots(args.reports or None, args.formats, concurrency=args.concurrency)
+    except RuntimeError as e:
+        print(f"  ❌ Snapshot export failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
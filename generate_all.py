@@ -1,22 +1,46 @@
 import pandas as pd
 from jinja2 import Template
+import argparse
 import os
+import sys
+import time
+from datetime import datetime
+from compare_reports import (
+    SNAPSHOT_FILE, compute_delta, export_delta, load_snapshot,
+    render_delta_report, save_snapshot,
+)
+from export_snapshots import (DEFAULT_CONCURRENCY, LOCAL_CHARTJS_FILE, export_snapshots, parse_concurrency,
+                              parse_formats)
+from report_config import ConfigError, load_config
+from report_index import build_failed_record, build_index, build_record, write_record
+from sharding import (assign_shards, clear_manifest, merge_shards, parse_shard, plan_units,
+                      write_manifest)
+from validate_data import SCHEMA, SchemaError, validate_workbook
 
 # Configuration
 EXCEL_FILE = 'qa_data.xlsx'
 TEMPLATE_FILE = 'template.html'
 OUTPUT_DIR = 'reports'
 
-def read_excel_data(sheet_name):
+def load_workbook_frames(excel_file=EXCEL_FILE, sheet_names=None):
+    """Parse the workbook once; only the given sheets if sheet_names is set"""
+    if sheet_names is None:
+        return pd.read_excel(excel_file, sheet_name=None, engine='openpyxl')
+    with pd.ExcelFile(excel_file, engine='openpyxl') as xls:
+        return {name: xls.parse(name) for name in sheet_names if name in xls.sheet_names}
+
+def read_excel_data(sheet_name, excel_file=EXCEL_FILE, df=None, config=None):
     """Read data from Excel sheet"""
-    df = pd.read_excel(EXCEL_FILE, sheet_name=sheet_name, engine='openpyxl')
+    report_config = (config or load_config()).for_sheet(sheet_name)
+    if df is None:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='openpyxl')
     
     # Extract metadata
-    lead_name = df.iloc[3, 1]  # Row 4, Column B
+    lead_name = df.iloc[SCHEMA['lead']['rows'][0], 1]  # Row 4, Column B
     
     # Extract test suites (rows 7-10 in pandas = rows 9-12 in openpyxl, columns A-G)
     summary_data = []
-    for row_idx in range(7, 11):
+    for row_idx in range(*SCHEMA['summary']['rows']):
         suite_name = df.iloc[row_idx, 0]
         total = df.iloc[row_idx, 1]
         passed = df.iloc[row_idx, 2]
@@ -33,17 +57,6 @@ def read_excel_data(sheet_name):
         blocked = int(blocked)
         pass_rate = round(passed / total * 100) if total > 0 else 0
         
-        # Determine status
-        if pass_rate >= 95:
-            status = 'Excellent'
-            status_class = 'status-pass'
-        elif pass_rate >= 85:
-            status = 'Good'
-            status_class = 'status-warn'
-        else:
-            status = 'Needs Improvement'
-            status_class = 'status-fail'
-        
         summary_data.append({
             'name': suite_name,
             'total': total,
@@ -51,10 +64,14 @@ def read_excel_data(sheet_name):
             'failed': failed,
             'blocked': blocked,
             'pass_rate': pass_rate,
-            'status': status,
-            'status_class': status_class
         })
     
+    # Determine status for all suites at once from the configured thresholds
+    statuses = report_config.classify([s['pass_rate'] for s in summary_data])
+    for suite, (status, status_class) in zip(summary_data, statuses):
+        suite['status'] = status
+        suite['status_class'] = status_class
+    
     # Calculate totals
     total_tests = sum(s['total'] for s in summary_data)
     total_passed = sum(s['passed'] for s in summary_data)
@@ -64,7 +81,7 @@ def read_excel_data(sheet_name):
     
     # Extract defects (rows 16-19 in pandas, columns A-B)
     defects = {}
-    for row_idx in range(16, 20):
+    for row_idx in range(*SCHEMA['defects']['rows']):
         priority = df.iloc[row_idx, 0]
         count = df.iloc[row_idx, 1]
         if not pd.isna(priority) and not pd.isna(count):
@@ -72,7 +89,7 @@ def read_excel_data(sheet_name):
     
     # Extract coverage (rows 23-26 in pandas, columns A-B)
     coverage = {}
-    for row_idx in range(23, 27):
+    for row_idx in range(*SCHEMA['coverage']['rows']):
         area = df.iloc[row_idx, 0]
         pct = df.iloc[row_idx, 1]
         if not pd.isna(area) and not pd.isna(pct):
@@ -80,7 +97,8 @@ def read_excel_data(sheet_name):
     
     # Extract risks (rows 29-31 in pandas = rows 31-33 in openpyxl, columns A-E)
     risks_data = []
-    for row_idx in range(29, min(32, len(df))):
+    risk_start, risk_stop = SCHEMA['risks']['rows']
+    for row_idx in range(risk_start, min(risk_stop, len(df))):
         if row_idx >= len(df):
             break
         issue_id = df.iloc[row_idx, 0]
@@ -116,38 +134,28 @@ def read_excel_data(sheet_name):
         'overall_pass_rate': overall_pass_rate,
     }
 
-def generate_html_report(report_type):
+def critical_issues_takeaway(priority_labels, defects):
+    """Summarise the two most severe configured priorities"""
+    top = priority_labels[0]
+    takeaway = f"<strong>Critical Issues:</strong> {defects.get(top, 0)} {top} defects."
+    if len(priority_labels) > 1:
+        second = priority_labels[1]
+        takeaway += f" {defects.get(second, 0)} {second} priority in progress."
+    return takeaway
+
+def generate_html_report(report_type, df=None, config=None):
     """Generate HTML report from Excel data"""
-    sheet_name = "API Data" if report_type == "api" else "Web Data"
-    excel_data = read_excel_data(sheet_name)
+    config = config or load_config()
+    report_config = config.for_report(report_type)
+    excel_data = read_excel_data(report_config.sheet, df=df, config=config)
     
     with open(TEMPLATE_FILE, 'r') as f:
         template_str = f.read()
     
     template = Template(template_str)
-    
-    if report_type == "api":
-        report_title = "API Testing Status Report"
-        report_subtitle = "E-Commerce Platform v2.0 | Week of Jan 6-12, 2026 | API Suite"
-        lead_title = "API Test Lead"
-        lead_initials = "DP"
-        objective = "Ensure backend stability, performance, and data integrity."
-        summary_title = "API Testing Summary"
-    else:
-        report_title = "Web Testing Status Report"
-        report_subtitle = "E-Commerce Platform v2.0 | Week of Jan 6-12, 2026 | Selenium Suite"
-        lead_title = "UI Test Lead"
-        lead_initials = "JM"
-        objective = "Validate user experience, cross-browser compatibility, and UI functionality."
-        summary_title = "Selenium (UI) Summary"
         
-    priority_labels = ["Critical", "High", "Medium", "Low"]
-    priority_data = [
-        excel_data['defects'].get('Critical', 0),
-        excel_data['defects'].get('High', 0),
-        excel_data['defects'].get('Medium', 0),
-        excel_data['defects'].get('Low', 0),
-    ]
+    priority_labels = list(report_config.priority_labels)
+    priority_data = [excel_data['defects'].get(label, 0) for label in priority_labels]
     
     ratio_data = [excel_data['overall_pass_rate'], 
                   round(excel_data['total_failed'] / excel_data['total_tests'] * 100) if excel_data['total_tests'] > 0 else 0,
@@ -156,21 +164,25 @@ def generate_html_report(report_type):
     coverage_labels = list(excel_data['coverage'].keys())
     coverage_data = list(excel_data['coverage'].values())
     
+    automation_coverage = report_config.automation_coverage
+    if automation_coverage is None:
+        automation_coverage = round(sum(coverage_data) / len(coverage_data)) if coverage_data else 0
+    
     takeaways = [
         f"<strong>Overall Status:</strong> {excel_data['overall_pass_rate']}% Pass Rate. {excel_data['total_tests']} Tests Executed.",
         f"<strong>Performance:</strong> System stable. {excel_data['total_passed']} tests passed.",
-        f"<strong>Automation:</strong> 78% coverage achieved.",
-        f"<strong>Critical Issues:</strong> {excel_data['defects'].get('Critical', 0)} Critical defects. {excel_data['defects'].get('High', 0)} High priority in progress.",
+        f"<strong>Automation:</strong> {automation_coverage}% coverage achieved.",
+        critical_issues_takeaway(priority_labels, excel_data['defects']),
     ]
     
     html_content = template.render(
-        report_title=report_title,
-        report_subtitle=report_subtitle,
-        lead_title=lead_title,
-        lead_initials=lead_initials,
+        report_title=report_config.report_title,
+        report_subtitle=report_config.report_subtitle,
+        lead_title=report_config.lead_title,
+        lead_initials=report_config.lead_initials,
         lead_name=excel_data['lead_name'],
-        objective=objective,
-        summary_title=summary_title,
+        objective=report_config.objective,
+        summary_title=report_config.summary_title,
         takeaways=takeaways,
         summary_data=excel_data['summary_data'],
         risks_data=excel_data['risks_data'],
@@ -190,43 +202,219 @@ def generate_html_report(report_type):
     
     return html_content, excel_data
 
-def export_html(html_content, report_type):
+def export_html(html_content, report_type, output_dir=OUTPUT_DIR):
     """Export to HTML file"""
     # Ensure output directory exists
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
     
-    filename = f"{OUTPUT_DIR}/{report_type}_report.html"
+    filename = f"{output_dir}/{report_type}_report.html"
     with open(filename, 'w') as f:
         f.write(html_content)
     print(f"  ✓ HTML: {filename}")
     return filename
 
-def main():
+def load_baseline(path, config=None):
+    """Load a baseline run from a previous workbook or a cached snapshot"""
+    if path.endswith('.json'):
+        return load_snapshot(path)
+    config = config or load_config()
+    frames = load_workbook_frames(path)
+    errors = validate_workbook(frames, config.sheet_names.values())
+    if errors:
+        raise SchemaError(errors)
+    return {
+        report_type: read_excel_data(sheet_name, df=frames[sheet_name], config=config)
+        for report_type, sheet_name in config.sheet_names.items()
+    }
+
+def print_validation_errors(source, errors):
+    """Print every schema error of a workbook, one cell per line"""
+    print(f"❌ {source} failed validation ({len(errors)} error(s)):")
+    for error in errors:
+        print(f"  - {error}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate HTML QA reports from qa_data.xlsx")
+    parser.add_argument('workbooks', nargs='*', default=[EXCEL_FILE],
+                        help="workbooks to report on (default: qa_data.xlsx)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR,
+                        help="directory for generated reports (default: reports)")
+    parser.add_argument('--config', metavar='FILE',
+                        help="report metadata and thresholds (.json, .toml or .yaml)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="previous workbook (.xlsx) or cached snapshot (.json) to diff against")
+    parser.add_argument('--export', metavar='FORMATS', type=parse_formats,
+                        help="also export static snapshots, e.g. 'pdf', 'png' or 'pdf,png' (requires Playwright)")
+    parser.add_argument('--concurrency', type=parse_concurrency, default=DEFAULT_CONCURRENCY,
+                        help="number of snapshots rendered in parallel")
+    parser.add_argument('--shard', metavar='i/N',
+                        help="only generate the i-th of N deterministic, cost-balanced shards")
+    parser.add_argument('--merge-shards', metavar='N', type=int,
+                        help="merge the manifests of N shards into shards.html and exit")
+    parser.add_argument('--run-id', metavar='ID',
+                        help="stamp shard manifests with this id; --merge-shards then ignores other runs")
+    args = parser.parse_args(argv)
+
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.merge_shards is not None:
+        if args.merge_shards < 1:
+            parser.error("--merge-shards needs a shard count of at least 1")
+        if args.shard:
+            parser.error("--merge-shards cannot be combined with --shard")
+    # A workbook baseline is keyed by report type, which only identifies reports of a single workbook
+    if args.compare and not args.compare.endswith('.json') and len(args.workbooks) > 1:
+        parser.error("--compare with several workbooks needs a .json snapshot of a run over the same workbooks")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    output_dir = args.output_dir
+
+    if args.merge_shards is not None:
+        print(f"🧩 Merging {args.merge_shards} shard manifests...")
+        summary = merge_shards(output_dir, args.merge_shards, args.run_id)
+        build_index(output_dir)
+        if summary['missing'] or summary['failed']:
+            print(f"  ❌ {len(summary['missing'])} shard(s) missing, {len(summary['failed'])} report(s) failed")
+            sys.exit(1)
+        return
+
+    # Fail before generating anything rather than export chart-less snapshots
+    if args.export and not os.path.isfile(LOCAL_CHARTJS_FILE):
+        print(f"❌ --export needs a local Chart.js at {LOCAL_CHARTJS_FILE} (chart.js@3.9.1, chart.min.js)")
+        sys.exit(1)
+
+    try:
+        config = load_config(args.config)
+    except (ConfigError, OSError) as e:
+        print(f"❌ Could not load config {args.config}: {e}")
+        sys.exit(1)
+    try:
+        # Only shards need cost estimates, which open every workbook up front
+        units = plan_units(args.workbooks, config, estimate_costs=bool(args.shard))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except OSError as e:
+        print(f"❌ Cannot read workbook {e.filename}: {e.strerror or e}")
+        sys.exit(1)
+    if args.shard:
+        shard_index, shard_count = args.shard
+        units = assign_shards(units, shard_count)[shard_index - 1]
+        # If this shard dies before finishing, the merge must not pick up last run's manifest
+        clear_manifest(output_dir, shard_index, shard_count)
+
     print("="*60)
     print("QA REPORTING SYSTEM - HTML Report Generator")
+    if args.shard:
+        print(f"Shard {shard_index}/{shard_count}: {len(units)} report(s)")
     print("="*60)
     
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    # Parse and validate every workbook this run needs before rendering anything
+    frames = {}
+    invalid = False
+    for workbook in dict.fromkeys(unit['workbook'] for unit in units):
+        sheets = list(dict.fromkeys(unit['sheet'] for unit in units if unit['workbook'] == workbook))
+        try:
+            frames[workbook] = load_workbook_frames(workbook, sheets)
+        except OSError as e:
+            print(f"❌ Cannot read workbook {workbook}: {e.strerror or e}")
+            invalid = True
+            continue
+        errors = validate_workbook(frames[workbook], sheets)
+        if errors:
+            print_validation_errors(workbook, errors)
+            invalid = True
+    if invalid:
+        sys.exit(1)
+
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    # Load the baseline before this run overwrites the cached snapshot
+    try:
+        baseline = load_baseline(args.compare, config) if args.compare else None
+    except SchemaError as e:
+        print_validation_errors(f"Baseline {args.compare}", e.errors)
+        sys.exit(1)
+    run_data = {}
+    written = []
+    entries = []
+    started_at = datetime.now().isoformat(timespec='seconds')
+    run_start = time.perf_counter()
         
-    for report_type in ["api", "web"]:
-        print(f"📊 Generating {report_type.upper()} Report...")
+    for unit in units:
+        name = unit['name']
+        report_config = config.for_report(unit['report_type'])
+        print(f"📊 Generating {name.upper()} Report...")
+        unit_start = time.perf_counter()
         
         try:
-            html_content, _ = generate_html_report(report_type)
-            export_html(html_content, report_type)
-            print(f"  ✓ {report_type.upper()} report complete!\n")
+            html_content, excel_data = generate_html_report(
+                unit['report_type'], df=frames[unit['workbook']][unit['sheet']], config=config)
+            written.append(export_html(html_content, name, output_dir))
+            run_data[name] = excel_data
+            write_record(output_dir, build_record(name, report_config, excel_data, unit['workbook']))
+
+            if baseline is not None and name in baseline:
+                delta = compute_delta(excel_data, baseline[name])
+                delta_html = render_delta_report(
+                    delta, report_config.report_title, args.compare)
+                written.append(export_delta(delta_html, name, output_dir))
+            elif baseline is not None:
+                print(f"  ⚠ {args.compare} has no '{name}' report - no delta written")
+
+            error = None
+            print(f"  ✓ {name.upper()} report complete!\n")
         
         except Exception as e:
-            print(f"  ❌ ERROR generating {report_type.upper()} report: {e}")
+            error = str(e)
+            print(f"  ❌ ERROR generating {name.upper()} report: {e}")
+            write_record(output_dir, build_failed_record(name, report_config, unit['workbook'], error))
             import traceback
             traceback.print_exc()
             print("\n")
 
+        entries.append({
+            'name': name,
+            'workbook': unit['workbook'],
+            'sheet': unit['sheet'],
+            'output': f"{name}_report.html",
+            'cost': unit['cost'],
+            'seconds': round(time.perf_counter() - unit_start, 3),
+            'ok': error is None,
+            'error': error,
+        })
+
+    if args.shard:
+        write_manifest(output_dir, shard_index, shard_count, started_at,
+                       time.perf_counter() - run_start, entries, run_data, args.run_id)
+    else:
+        # A partial snapshot would make the next --compare silently skip the failed reports
+        if all(entry['ok'] for entry in entries):
+            save_snapshot(run_data, f"{output_dir}/{SNAPSHOT_FILE}")
+        else:
+            print(f"  ⚠ Some reports failed - {output_dir}/{SNAPSHOT_FILE} was not updated")
+        # Shards share the output directory, so their index is built by the merge step
+        build_index(output_dir)
+
+    if args.export:
+        print("📸 Exporting snapshots...")
+        try:
+            export_snapshots(written, formats=args.export,
+                             snapshot_dir=f"{output_dir}/snapshots", concurrency=args.concurrency)
+        except RuntimeError as e:
+            print(f"  ❌ Snapshot export failed: {e}")
+            sys.exit(1)
+
     print("="*60)
     print("✓ All reports generated successfully!")
-    print(f"📁 Output directory: {OUTPUT_DIR}/")
+    print(f"📁 Output directory: {output_dir}/")
     print("="*60)
 
 if __name__ == "__main__":
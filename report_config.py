@@ -0,0 +1,237 @@
+"""
+Report metadata and status thresholds
+Loaded once from JSON/TOML/YAML, validated and frozen into immutable objects
+"""
+
+import copy
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+
+# Built-in defaults; a config file only needs to contain the keys it changes.
+# Every key of "defaults" can also be overridden per report section, and a report
+# is dropped by setting its section to null or giving it "enabled: false".
+DEFAULT_CONFIG = {
+    'defaults': {
+        'thresholds': [
+            {'min_pass_rate': 95, 'status': 'Excellent', 'status_class': 'status-pass'},
+            {'min_pass_rate': 85, 'status': 'Good', 'status_class': 'status-warn'},
+            {'min_pass_rate': 0, 'status': 'Needs Improvement', 'status_class': 'status-fail'},
+        ],
+        'priority_labels': ['Critical', 'High', 'Medium', 'Low'],
+        'automation_coverage': 78,
+    },
+    'reports': {
+        'api': {
+            'sheet': 'API Data',
+            'report_title': 'API Testing Status Report',
+            'report_subtitle': 'E-Commerce Platform v2.0 | Week of Jan 6-12, 2026 | API Suite',
+            'lead_title': 'API Test Lead',
+            'lead_initials': 'DP',
+            'objective': 'Ensure backend stability, performance, and data integrity.',
+            'summary_title': 'API Testing Summary',
+        },
+        'web': {
+            'sheet': 'Web Data',
+            'report_title': 'Web Testing Status Report',
+            'report_subtitle': 'E-Commerce Platform v2.0 | Week of Jan 6-12, 2026 | Selenium Suite',
+            'lead_title': 'UI Test Lead',
+            'lead_initials': 'JM',
+            'objective': 'Validate user experience, cross-browser compatibility, and UI functionality.',
+            'summary_title': 'Selenium (UI) Summary',
+        },
+    },
+}
+
+TEXT_KEYS = ['sheet', 'report_title', 'report_subtitle', 'lead_title', 'lead_initials',
+             'objective', 'summary_title']
+REPORT_KEYS = set(TEXT_KEYS) | set(DEFAULT_CONFIG['defaults'])
+
+class ConfigError(ValueError):
+    """Raised when a config file is malformed"""
+
+@dataclass(frozen=True)
+class StatusThreshold:
+    min_pass_rate: int
+    status: str
+    status_class: str
+
+@dataclass(frozen=True)
+class ReportConfig:
+    report_type: str
+    sheet: str
+    report_title: str
+    report_subtitle: str
+    lead_title: str
+    lead_initials: str
+    objective: str
+    summary_title: str
+    priority_labels: tuple
+    automation_coverage: object  # int, or None to use the average of the coverage table
+    thresholds: tuple  # StatusThreshold, sorted by ascending min_pass_rate
+
+    def classify(self, pass_rates):
+        """Map pass rates to (status, status_class) pairs with one vectorized lookup"""
+        bounds = np.array([t.min_pass_rate for t in self.thresholds])
+        indexes = np.searchsorted(bounds, np.asarray(pass_rates), side='right') - 1
+        return [(self.thresholds[i].status, self.thresholds[i].status_class) for i in indexes]
+
+@dataclass(frozen=True)
+class Config:
+    reports: tuple  # ReportConfig, in config file order
+
+    @property
+    def sheet_names(self):
+        return {r.report_type: r.sheet for r in self.reports}
+
+    def for_report(self, report_type):
+        for report in self.reports:
+            if report.report_type == report_type:
+                return report
+        raise KeyError(f"No report configured for type '{report_type}'")
+
+    def for_sheet(self, sheet_name):
+        for report in self.reports:
+            if report.sheet == sheet_name:
+                return report
+        raise KeyError(f"No report configured for sheet '{sheet_name}'")
+
+def _parse_file(path):
+    """Parse a config file according to its extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path, 'r') as f:
+            try:
+                return json.load(f)
+            except ValueError as e:
+                raise ConfigError(f"not valid JSON: {e}")
+    if ext == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ConfigError("TOML config files require Python 3.11+")
+        with open(path, 'rb') as f:
+            try:
+                return tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise ConfigError(f"not valid TOML: {e}")
+    if ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ConfigError("YAML config files require PyYAML: pip install pyyaml")
+        with open(path, 'r') as f:
+            try:
+                return yaml.safe_load(f) or {}
+            except yaml.YAMLError as e:
+                raise ConfigError(f"not valid YAML: {e}")
+    raise ConfigError(f"Unsupported config format '{ext}' (use .json, .toml or .yaml)")
+
+def _merge(base, override):
+    """Recursively merge override into a copy of base"""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def _build_thresholds(raw, where):
+    if not isinstance(raw, list) or not raw:
+        raise ConfigError(f"{where}.thresholds must be a non-empty list")
+    thresholds = []
+    for i, entry in enumerate(raw):
+        if not isinstance(entry, dict) or set(entry) != {'min_pass_rate', 'status', 'status_class'}:
+            raise ConfigError(f"{where}.thresholds[{i}] needs exactly min_pass_rate, status and status_class")
+        rate = entry['min_pass_rate']
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 <= rate <= 100:
+            raise ConfigError(f"{where}.thresholds[{i}].min_pass_rate must be a number from 0 to 100")
+        thresholds.append(StatusThreshold(rate, str(entry['status']), str(entry['status_class'])))
+
+    thresholds.sort(key=lambda t: t.min_pass_rate)
+    rates = [t.min_pass_rate for t in thresholds]
+    if rates[0] != 0:
+        raise ConfigError(f"{where}.thresholds must include a threshold with min_pass_rate 0")
+    if len(set(rates)) != len(rates):
+        raise ConfigError(f"{where}.thresholds has duplicate min_pass_rate values")
+    return tuple(thresholds)
+
+def _build_report(report_type, raw, defaults):
+    where = f"reports.{report_type}"
+    if not isinstance(raw, dict):
+        raise ConfigError(f"{where} must be a table of settings")
+    unknown = set(raw) - REPORT_KEYS
+    if unknown:
+        raise ConfigError(f"{where} has unknown key(s): {', '.join(sorted(unknown))}")
+
+    settings = {**defaults, **raw}
+    missing = [key for key in TEXT_KEYS if key not in settings]
+    if missing:
+        raise ConfigError(f"{where} is missing: {', '.join(missing)}")
+    for key in TEXT_KEYS:
+        if not isinstance(settings[key], str):
+            raise ConfigError(f"{where}.{key} must be a string")
+
+    labels = settings['priority_labels']
+    if not isinstance(labels, list) or not labels or not all(isinstance(l, str) for l in labels):
+        raise ConfigError(f"{where}.priority_labels must be a non-empty list of strings")
+
+    coverage = settings['automation_coverage']
+    if coverage is not None and (isinstance(coverage, bool) or not isinstance(coverage, (int, float))):
+        raise ConfigError(f"{where}.automation_coverage must be a number or null")
+
+    return ReportConfig(
+        report_type=report_type,
+        priority_labels=tuple(labels),
+        automation_coverage=coverage,
+        thresholds=_build_thresholds(settings['thresholds'], where),
+        **{key: settings[key] for key in TEXT_KEYS},
+    )
+
+def build_config(raw):
+    """Validate a parsed config mapping and freeze it"""
+    if not isinstance(raw, dict):
+        raise ConfigError("Config must be a mapping")
+    unknown = set(raw) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ConfigError(f"Unknown top-level key(s): {', '.join(sorted(unknown))}")
+    for section in DEFAULT_CONFIG:
+        if section in raw and not isinstance(raw[section], dict):
+            raise ConfigError(f"{section} must be a table of settings")
+    for report_type, report in raw.get('reports', {}).items():
+        if report is not None and not isinstance(report, dict):
+            raise ConfigError(f"reports.{report_type} must be a table of settings or null")
+
+    merged = _merge(DEFAULT_CONFIG, raw)
+    defaults = merged['defaults']
+    unknown = set(defaults) - set(DEFAULT_CONFIG['defaults'])
+    if unknown:
+        raise ConfigError(f"defaults has unknown key(s): {', '.join(sorted(unknown))}")
+
+    reports = []
+    for report_type, report in merged['reports'].items():
+        if report is None:
+            continue
+        report = dict(report)
+        enabled = report.pop('enabled', True)
+        if not isinstance(enabled, bool):
+            raise ConfigError(f"reports.{report_type}.enabled must be true or false")
+        if enabled:
+            reports.append(_build_report(report_type, report, defaults))
+    if not reports:
+        raise ConfigError("At least one report must be enabled")
+
+    reports = tuple(reports)
+    sheets = [r.sheet for r in reports]
+    if len(set(sheets)) != len(sheets):
+        raise ConfigError("Each report must use a different sheet")
+    return Config(reports=reports)
+
+@lru_cache(maxsize=None)
+def load_config(path=None):
+    """Load, validate and freeze a config file; parsed once per path and process"""
+    raw = _parse_file(path) if path else {}
+    return build_config(raw)
@@ -0,0 +1,130 @@
+"""
+Dashboard of all generated reports
+Each report leaves a small metadata record; reports/index.html is rebuilt from those
+records, re-reading only the ones that changed since the last build
+"""
+
+import json
+import os
+from datetime import datetime
+from jinja2 import Template
+
+META_DIR = 'meta'
+INDEX_CACHE_FILE = '_index_cache.json'
+INDEX_TEMPLATE_FILE = 'index_template.html'
+INDEX_FILE = 'index.html'
+
+def build_record(name, report_config, excel_data, workbook):
+    """Summarise one generated report for the dashboard"""
+    return {
+        'name': name,
+        'title': report_config.report_title,
+        'report': f"{name}_report.html",
+        'workbook': workbook,
+        'sheet': report_config.sheet,
+        'pass_rate': excel_data['overall_pass_rate'],
+        'total': excel_data['total_tests'],
+        'passed': excel_data['total_passed'],
+        'failed': excel_data['total_failed'],
+        'blocked': excel_data['total_blocked'],
+        'critical_label': report_config.priority_labels[0],
+        'critical_defects': excel_data['defects'].get(report_config.priority_labels[0], 0),
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'error': None,
+    }
+
+def build_failed_record(name, report_config, workbook, error):
+    """Replace a report's record when it fails, so the dashboard never shows stale figures"""
+    return {
+        'name': name,
+        'title': report_config.report_title,
+        'report': None,
+        'workbook': workbook,
+        'sheet': report_config.sheet,
+        'pass_rate': None,
+        'total': None,
+        'passed': None,
+        'failed': None,
+        'blocked': None,
+        'critical_label': report_config.priority_labels[0],
+        'critical_defects': None,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'error': error,
+    }
+
+def _write_json(path, data, **kwargs):
+    """Write JSON through a temporary file so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp_path, path)
+
+def write_record(output_dir, record):
+    """Write a report's metadata record next to the reports"""
+    meta_dir = os.path.join(output_dir, META_DIR)
+    if not os.path.exists(meta_dir):
+        os.makedirs(meta_dir)
+
+    path = os.path.join(meta_dir, f"{record['name']}.json")
+    _write_json(path, record, indent=2)
+    return path
+
+def _load_cache(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+def build_index(output_dir):
+    """Refresh index.html, reading only records added or modified since the last build"""
+    meta_dir = os.path.join(output_dir, META_DIR)
+    cache_path = os.path.join(meta_dir, INDEX_CACHE_FILE)
+    index_path = os.path.join(output_dir, INDEX_FILE)
+    if not os.path.isdir(meta_dir):
+        return None
+
+    # Cache maps record file name -> {'stamp': [mtime, size], 'record': ...}
+    cache = _load_cache(cache_path)
+    entries = {}
+    changed = 0
+    with os.scandir(meta_dir) as it:
+        for entry in it:
+            if not entry.name.endswith('.json') or entry.name == INDEX_CACHE_FILE:
+                continue
+            stat = entry.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(entry.name)
+            if cached and cached.get('stamp') == stamp:
+                entries[entry.name] = cached
+                continue
+            try:
+                with open(entry.path, 'r') as f:
+                    entries[entry.name] = {'stamp': stamp, 'record': json.load(f)}
+            except ValueError as e:
+                # Listed as failed and left out of the cache, so it is re-read on the next build
+                name = entry.name[:-len('.json')]
+                print(f"  ⚠ Unreadable record {entry.path}: {e}")
+                entries[entry.name] = {'stamp': None, 'record': {
+                    'name': name, 'title': name, 'error': f"Unreadable metadata record: {e}"}}
+            changed += 1
+
+    removed = len(set(cache) - set(entries))
+    if not changed and not removed and os.path.exists(index_path):
+        return index_path
+
+    _write_json(cache_path, entries)
+
+    records = sorted((e['record'] for e in entries.values()), key=lambda r: r['name'])
+    with open(INDEX_TEMPLATE_FILE, 'r') as f:
+        template = Template(f.read())
+    with open(index_path, 'w') as f:
+        f.write(template.render(
+            records=records,
+            built_at=datetime.now().isoformat(timespec='seconds'),
+        ))
+
+    print(f"  ✓ Index: {index_path} ({changed} updated, {removed} removed, {len(records)} total)")
+    return index_path
@@ -0,0 +1,178 @@
+"""
+Sharded report generation
+Splits (workbook, sheet) work units deterministically across N generator processes
+and merges their manifests into one index page
+"""
+
+import json
+import os
+from datetime import datetime
+from jinja2 import Template
+from openpyxl import load_workbook
+from compare_reports import SNAPSHOT_FILE, load_snapshot, save_snapshot
+
+SHARD_DIR = 'shards'
+SHARD_TEMPLATE_FILE = 'shards_template.html'
+SHARD_INDEX_FILE = 'shards.html'
+
+# Estimated cost of one work unit: a fixed render overhead plus the unit's share of
+# its workbook's file size, split between sheets by row count
+UNIT_OVERHEAD_BYTES = 64 * 1024
+
+def parse_shard(value):
+    """Parse '--shard i/N' (1-based) into (i, N)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got '{value}'")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and N, got '{value}'")
+    return index, count
+
+def _sheet_rows(workbook, sheet_names):
+    """Row counts read from the sheet dimensions, without parsing cell data"""
+    wb = load_workbook(workbook, read_only=True)
+    try:
+        return {name: (wb[name].max_row or 0) if name in wb.sheetnames else 0 for name in sheet_names}
+    finally:
+        wb.close()
+
+def _workbook_labels(workbooks):
+    """Name each workbook by its path relative to their common directory"""
+    paths = [os.path.abspath(w) for w in workbooks]
+    common = os.path.commonpath([os.path.dirname(p) for p in paths])
+    return [
+        os.path.splitext(os.path.relpath(p, common))[0].replace(os.sep, '_')
+        for p in paths
+    ]
+
+def plan_units(workbooks, config, estimate_costs=True):
+    """List every (workbook, report) unit with its output name and estimated cost
+
+    Estimating costs reads every workbook; without it the cost is None and no
+    file is touched.
+    """
+    prefixed = len(workbooks) > 1
+    labels = _workbook_labels(workbooks)
+    units = []
+    for workbook, stem in zip(workbooks, labels):
+        if estimate_costs:
+            size = os.path.getsize(workbook)
+            rows = _sheet_rows(workbook, [r.sheet for r in config.reports])
+            total_rows = sum(rows.values()) or 1
+
+        for report in config.reports:
+            units.append({
+                'name': f"{stem}_{report.report_type}" if prefixed else report.report_type,
+                'workbook': workbook,
+                'report_type': report.report_type,
+                'sheet': report.sheet,
+                'cost': UNIT_OVERHEAD_BYTES + round(size * rows[report.sheet] / total_rows)
+                        if estimate_costs else None,
+            })
+
+    # Reports, meta records and snapshot keys are all named after the unit
+    seen = {}
+    for unit in units:
+        if unit['name'] in seen:
+            raise ValueError(
+                f"{unit['workbook']} and {seen[unit['name']]} would both write '{unit['name']}' reports"
+            )
+        seen[unit['name']] = unit['workbook']
+    return units
+
+def assign_shards(units, shard_count):
+    """Greedy longest-processing-time assignment; identical in every process"""
+    shards = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for unit in sorted(units, key=lambda u: (-u['cost'], u['name'])):
+        target = min(range(shard_count), key=lambda i: (loads[i], i))
+        shards[target].append(unit)
+        loads[target] += unit['cost']
+    return shards
+
+def _shard_path(output_dir, index, count, kind):
+    return os.path.join(output_dir, SHARD_DIR, f"{kind}-{index}-of-{count}.json")
+
+def clear_manifest(output_dir, index, count):
+    """Remove this shard's manifest from an earlier run, so a crash leaves it missing"""
+    for kind in ('manifest', 'snapshot'):
+        path = _shard_path(output_dir, index, count, kind)
+        if os.path.exists(path):
+            os.remove(path)
+
+def write_manifest(output_dir, index, count, started_at, elapsed, entries, run_data, run_id=None):
+    """Record what one shard produced, how long it took, and its snapshot data"""
+    shard_dir = os.path.join(output_dir, SHARD_DIR)
+    if not os.path.exists(shard_dir):
+        os.makedirs(shard_dir)
+
+    manifest = {
+        'shard': index,
+        'shard_count': count,
+        'run_id': run_id,
+        'started_at': started_at,
+        'elapsed': round(elapsed, 3),
+        'reports': entries,
+    }
+    path = _shard_path(output_dir, index, count, 'manifest')
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    save_snapshot(run_data, _shard_path(output_dir, index, count, 'snapshot'))
+    print(f"  ✓ Manifest: {path}")
+    return path
+
+def merge_shards(output_dir, shard_count, run_id=None):
+    """Combine per-shard manifests and snapshots into one index page and snapshot
+
+    With a run_id, manifests stamped with a different run count as missing.
+    """
+    manifests = []
+    missing = []
+    run_data = {}
+    for index in range(1, shard_count + 1):
+        path = _shard_path(output_dir, index, shard_count, 'manifest')
+        if not os.path.exists(path):
+            missing.append(index)
+            continue
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+        if run_id is not None and manifest.get('run_id') != run_id:
+            missing.append(index)
+            continue
+        manifests.append(manifest)
+        snapshot_path = _shard_path(output_dir, index, shard_count, 'snapshot')
+        if os.path.exists(snapshot_path):
+            run_data.update(load_snapshot(snapshot_path))
+
+    reports = sorted(
+        (dict(entry, shard=m['shard']) for m in manifests for entry in m['reports']),
+        key=lambda entry: entry['name'],
+    )
+    elapsed = [m['elapsed'] for m in manifests]
+    summary = {
+        'shard_count': shard_count,
+        'run_id': run_id,
+        'missing': missing,
+        'manifests': manifests,
+        'reports': reports,
+        'failed': [entry for entry in reports if not entry['ok']],
+        'wall_time': max(elapsed, default=0),
+        'total_time': round(sum(elapsed), 3),
+        'merged_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+    with open(SHARD_TEMPLATE_FILE, 'r') as f:
+        template = Template(f.read())
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    index_path = os.path.join(output_dir, SHARD_INDEX_FILE)
+    with open(index_path, 'w') as f:
+        f.write(template.render(summary=summary))
+
+    # Only a complete run may replace the snapshot used by --compare
+    if not missing and not summary['failed']:
+        save_snapshot(run_data, os.path.join(output_dir, SNAPSHOT_FILE))
+
+    print(f"  ✓ Shard index: {index_path}")
+    return summary
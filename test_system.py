@@ -6,10 +6,15 @@ Tests report generation, data integrity, chart accuracy, and output validation
 import os
 import shutil
 import json
+import subprocess
+import sys
+import tempfile
 import re
 import pandas as pd
 from pathlib import Path
-from generate_all import generate_html_report, export_html, read_excel_data
+from generate_all import generate_html_report, export_html, read_excel_data, load_workbook_frames, load_baseline
+from compare_reports import compute_delta, render_delta_report, save_snapshot
+from validate_data import validate_workbook
 
 class TestSuite:
     def __init__(self):
@@ -25,6 +30,12 @@ class TestSuite:
         if message:
             print(f"       {message}")
         self.test_results.append({'test': test_name, 'passed': passed, 'message': message})
+    
+    def log_skip(self, test_name, reason):
+        """Log a test that could not run in this environment; never counted as passed"""
+        print(f"- SKIP: {test_name}")
+        print(f"       {reason}")
+        self.test_results.append({'test': test_name, 'passed': None, 'message': reason})
         
     def test_1_report_generation(self):
         """Test 1: Verify HTML reports are generated"""
@@ -185,6 +196,500 @@ class TestSuite:
                 os.remove(self.backup_file)
             return False
     
+    def test_4_compare_runs(self):
+        """Test 4: Verify delta report between a baseline and the current run"""
+        print("\n[TEST 4] Compare Runs")
+        print("-" * 60)
+        
+        snapshot_file = 'qa_snapshot_test.json'
+        try:
+            current = read_excel_data("API Data")
+            baseline = json.loads(json.dumps(current, default=str))
+            
+            # Shift the baseline: one suite renamed, one risk dropped, one risk added
+            first_suite = current['summary_data'][0]
+            baseline['summary_data'][0]['pass_rate'] = first_suite['pass_rate'] - 10
+            baseline['summary_data'][1]['name'] = "RETIRED_SUITE_XYZ"
+            baseline['risks_data'] = baseline['risks_data'][1:] + [
+                {'id': 'OLD-999', 'description': 'RESOLVED_RISK_XYZ', 'priority': 'HIGH', 'owner': 'Nobody'}
+            ]
+            baseline['defects']['Critical'] = current['defects'].get('Critical', 0) + 5
+            baseline['overall_pass_rate'] = current['overall_pass_rate'] - 3
+            
+            delta = compute_delta(current, baseline)
+            suites = {s['name']: s for s in delta['suites']}
+            defects = {d['priority']: d for d in delta['defects']}
+            
+            self.log_test("Suite pass-rate change", suites[first_suite['name']]['change'] == 10)
+            self.log_test("Removed suite detected", suites["RETIRED_SUITE_XYZ"]['state'] == 'removed')
+            self.log_test("New suite detected", suites[current['summary_data'][1]['name']]['state'] == 'new')
+            self.log_test("New risk detected",
+                          [r['id'] for r in delta['new_risks']] == [current['risks_data'][0]['id']])
+            self.log_test("Resolved risk detected",
+                          [r['id'] for r in delta['resolved_risks']] == ['OLD-999'])
+            self.log_test("Critical defect movement", defects['Critical']['change'] == -5)
+            self.log_test("Overall pass-rate change", delta['overall']['change'] == 3)
+            
+            html_delta = render_delta_report(delta, "API Testing Status Report", "baseline.json")
+            self.log_test("Delta report lists resolved risk", "RESOLVED_RISK_XYZ" in html_delta)
+            self.log_test("Delta report shows change", "+10" in html_delta)
+            
+            # The CLI paths: an .xlsx baseline, cached to a .json snapshot and loaded back
+            workbook_baseline = load_baseline(self.excel_file)
+            save_snapshot(workbook_baseline, snapshot_file)
+            snapshot_baseline = load_baseline(snapshot_file)
+            self.log_test("Workbook baseline keyed by report type", sorted(workbook_baseline) == ['api', 'web'])
+            self.log_test("Snapshot round trip keeps every report", sorted(snapshot_baseline) == ['api', 'web'])
+            
+            for label, loaded in [("Workbook", workbook_baseline), ("Snapshot", snapshot_baseline)]:
+                delta = compute_delta(current, loaded['api'])
+                self.log_test(f"{label} baseline: identical run is unchanged",
+                              all(s['state'] == 'unchanged' for s in delta['suites'])
+                              and not delta['new_risks'] and not delta['resolved_risks']
+                              and delta['overall']['change'] == 0
+                              and all(d['change'] == 0 for d in delta['defects']))
+
+            # Rows with a repeated key cannot be matched, so the join refuses them
+            duplicated = dict(current, summary_data=current['summary_data'] + current['summary_data'][:1])
+            try:
+                compute_delta(duplicated, duplicated)
+                self.log_test("Duplicate suite names rejected by the join", False)
+            except ValueError:
+                self.log_test("Duplicate suite names rejected by the join", True)
+
+            return True
+            
+        except Exception as e:
+            self.log_test("Compare runs", False, str(e))
+            return False
+        
+        finally:
+            if os.path.exists(snapshot_file):
+                os.remove(snapshot_file)
+    
+    def test_5_snapshot_export(self):
+        """Test 5: Verify PDF/PNG snapshots are exported through one renderer pool"""
+        print("\n[TEST 5] Snapshot Export")
+        print("-" * 60)
+        
+        work_dir = tempfile.mkdtemp(prefix='qa_snapshots_')
+        snapshot_dir = os.path.join(work_dir, "snapshots")
+        try:
+            from export_snapshots import LOCAL_CHARTJS_FILE, export_snapshots, find_reports
+            
+            html_files = find_reports(self.reports_dir)
+            
+            # Without a local Chart.js the export must refuse rather than draw blank charts
+            try:
+                export_snapshots(html_files, snapshot_dir=snapshot_dir,
+                                 chartjs_file=os.path.join(work_dir, "missing_chart.min.js"))
+                refused = False
+            except RuntimeError as e:
+                refused = "not found" in str(e)
+            self.log_test("Export refuses to run without local Chart.js",
+                          refused and not os.path.exists(snapshot_dir))
+            with open(LOCAL_CHARTJS_FILE) as f:
+                self.log_test("Chart.js v3.9.1 vendored for offline export", "Chart.js v3.9.1" in f.read(200))
+            
+            # Bad export options must stop the run before any report is generated
+            output_dir = os.path.join(work_dir, "reports")
+            for bad_args in (["--export", "jpg"], ["--export", "pdf", "--concurrency", "0"]):
+                bad = subprocess.run([sys.executable, "generate_all.py", "--output-dir", output_dir] + bad_args,
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                self.log_test(f"Rejects {' '.join(bad_args)} up front",
+                              bad.returncode == 2 and not os.path.exists(output_dir), bad.stderr.decode()[-200:])
+            
+            # Real run: more reports than pooled pages, all served by a single browser
+            batch = []
+            for i in range(6):
+                source = html_files[i % len(html_files)]
+                path = os.path.join(work_dir, f"copy_{i}_{os.path.basename(source)}")
+                shutil.copy(source, path)
+                batch.append(path)
+            
+            stats = {}
+            try:
+                written = export_snapshots(batch, formats=('pdf', 'png'), snapshot_dir=snapshot_dir,
+                                           concurrency=2, stats=stats)
+            except RuntimeError as e:
+                if stats.get('browser_launches') or not (
+                        "not found" in str(e) or "Could not start" in str(e) or "requires Playwright" in str(e)):
+                    raise
+                self.log_skip("Snapshot export end to end", str(e))
+                return True
+            
+            self.log_test("One snapshot per report and format", len(written) == len(batch) * 2,
+                          f"expected {len(batch) * 2}, got {len(written)}")
+            self.log_test("One browser launch for the whole batch", stats['browser_launches'] == 1,
+                          f"{stats['browser_launches']} launches")
+            self.log_test("Page pool bounded by concurrency", stats['pages'] == 2, f"{stats['pages']} pages")
+            
+            def header(path, size):
+                with open(path, 'rb') as f:
+                    return f.read(size)
+            self.log_test("PDF files are valid",
+                          all(header(p, 5) == b'%PDF-' for p in written if p.endswith('.pdf')))
+            self.log_test("PNG files are valid",
+                          all(header(p, 8) == b'\x89PNG\r\n\x1a\n' for p in written if p.endswith('.png')))
+            
+            # A browser-side failure surfaces as a RuntimeError naming the report
+            missing_html = os.path.join(work_dir, "missing_report.html")
+            try:
+                export_snapshots([missing_html] + batch, formats=('pdf',), snapshot_dir=snapshot_dir, concurrency=2)
+                wrapped = False
+            except RuntimeError as e:
+                wrapped = missing_html in str(e)
+            self.log_test("Render failure reported with its file name", wrapped)
+            
+            return True
+            
+        except Exception as e:
+            self.log_test("Snapshot export", False, str(e))
+            return False
+        
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def test_6_schema_validation(self):
+        """Test 6: Verify malformed cells are reported with their coordinates"""
+        print("\n[TEST 6] Schema Validation")
+        print("-" * 60)
+        
+        broken_file = 'qa_data_broken.xlsx'
+        sheets = ["API Data", "Web Data"]
+        try:
+            errors = validate_workbook(load_workbook_frames(self.excel_file), sheets)
+            self.log_test("Original workbook is valid", not errors, "; ".join(errors))
+            
+            from openpyxl import load_workbook
+            wb_modify = load_workbook(self.excel_file)
+            ws_api = wb_modify['API Data']
+            ws_api['D9'] = "abc"   # Failed is not a number
+            ws_api['E10'] = None   # Blocked missing
+            ws_api['B11'] = 10     # Total smaller than passed + failed + blocked
+            ws_api['C12'] = -5     # Negative passed count
+            ws_api['A10'] = ws_api['A9'].value   # Suite name repeated
+            ws_api['A33'] = ws_api['A32'].value  # Issue ID repeated
+            del wb_modify['Web Data']
+            wb_modify.save(broken_file)
+            
+            errors = validate_workbook(load_workbook_frames(broken_file), sheets)
+            
+            self.log_test("Non-numeric cell reported", any(e.startswith("API Data!D9:") for e in errors))
+            self.log_test("Missing cell reported", any(e.startswith("API Data!E10:") for e in errors))
+            self.log_test("Count overflow reported", any(e.startswith("API Data!B11:") for e in errors))
+            self.log_test("Negative count reported", any(e.startswith("API Data!C12:") for e in errors))
+            self.log_test("Duplicate suite name reported",
+                          any(e.startswith("API Data!A10:") and "duplicates A9" in e for e in errors))
+            self.log_test("Duplicate issue id reported",
+                          any(e.startswith("API Data!A33:") and "duplicates A32" in e for e in errors))
+            self.log_test("Missing sheet reported", "Web Data: sheet not found" in errors)
+            self.log_test("All errors collected", len(errors) == 7,
+                          "" if len(errors) == 7 else "; ".join(errors))
+            
+            return True
+            
+        except Exception as e:
+            self.log_test("Schema validation", False, str(e))
+            return False
+        
+        finally:
+            if os.path.exists(broken_file):
+                os.remove(broken_file)
+    
+    def test_7_report_config(self):
+        """Test 7: Verify report metadata and thresholds come from a config file"""
+        print("\n[TEST 7] Report Config")
+        print("-" * 60)
+        
+        config_file = 'qa_config_test.json'
+        try:
+            import pickle
+            from dataclasses import FrozenInstanceError
+            from report_config import ConfigError, build_config, load_config
+            
+            with open(config_file, 'w') as f:
+                json.dump({
+                    'defaults': {'automation_coverage': 64},
+                    'reports': {
+                        'api': {
+                            'report_subtitle': 'CONFIGURED_SUBTITLE_XYZ',
+                            'thresholds': [
+                                {'min_pass_rate': 0, 'status': 'CONFIGURED_LOW', 'status_class': 'status-fail'},
+                                {'min_pass_rate': 99, 'status': 'CONFIGURED_HIGH', 'status_class': 'status-pass'},
+                            ],
+                        },
+                    },
+                }, f)
+            
+            config = load_config(config_file)
+            api = config.for_report("api")
+            web = config.for_report("web")
+            
+            self.log_test("Config parsed once", load_config(config_file) is config)
+            self.log_test("Per-report thresholds applied",
+                          api.classify([98, 99, 100]) == [('CONFIGURED_LOW', 'status-fail'),
+                                                          ('CONFIGURED_HIGH', 'status-pass'),
+                                                          ('CONFIGURED_HIGH', 'status-pass')])
+            self.log_test("Default thresholds kept elsewhere",
+                          [status for status, _ in web.classify([84, 85, 95])] == ['Needs Improvement', 'Good', 'Excellent'])
+            
+            try:
+                api.report_title = "changed"
+                frozen = False
+            except FrozenInstanceError:
+                frozen = True
+            self.log_test("Config is immutable", frozen)
+            self.log_test("Config is picklable for workers", pickle.loads(pickle.dumps(config)) == config)
+            
+            html_api, excel_data = generate_html_report("api", config=config)
+            self.log_test("Configured subtitle rendered", "CONFIGURED_SUBTITLE_XYZ" in html_api)
+            self.log_test("Configured coverage takeaway rendered", "64% coverage achieved" in html_api)
+            self.log_test("Configured status rendered",
+                          all(s['status'].startswith('CONFIGURED_') for s in excel_data['summary_data']))
+            
+            try:
+                build_config({'reports': {'api': {'thresholds': [{'min_pass_rate': 50, 'status': 'X', 'status_class': 'y'}]}}})
+                rejected = False
+            except ConfigError:
+                rejected = True
+            self.log_test("Thresholds without a 0 floor rejected", rejected)
+            
+            malformed = [{'reports': []}, {'defaults': None}, {'reports': {'api': 'x'}},
+                         {'reports': {'api': {'enabled': 'no'}}},
+                         {'reports': {'api': None, 'web': {'enabled': False}}}]
+            raised = []
+            for raw in malformed:
+                try:
+                    build_config(raw)
+                    raised.append(None)
+                except ConfigError:
+                    raised.append(ConfigError)
+                except Exception as e:
+                    raised.append(type(e))
+            all_config_errors = raised == [ConfigError] * len(malformed)
+            self.log_test("Malformed sections raise ConfigError", all_config_errors,
+                          "" if all_config_errors else str(raised))
+            
+            team = build_config({
+                'defaults': {'priority_labels': ['Blocker', 'Major', 'Minor']},
+                'reports': {'api': None, 'web': {'enabled': False},
+                            'mobile': {**{k: 'x' for k in ['report_title', 'report_subtitle', 'lead_title',
+                                                            'lead_initials', 'objective', 'summary_title']},
+                                       'sheet': 'API Data'}},
+            })
+            self.log_test("Default reports can be disabled", list(team.sheet_names) == ['mobile'])
+            
+            html_team, _ = generate_html_report("mobile", config=team)
+            self.log_test("Takeaway uses configured priority labels",
+                          " Blocker defects. " in html_team and " Major priority in progress." in html_team)
+
+            # A bad or missing config file stops the CLI with a message, not a traceback
+            with open(config_file, 'w') as f:
+                json.dump({'reports': {'api': {'unknown_key': 1}}}, f)
+            for path in (config_file, 'qa_config_missing.json'):
+                run = subprocess.run([sys.executable, "generate_all.py", "--config", path],
+                                     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                self.log_test(f"CLI rejects config {path} cleanly",
+                              run.returncode == 1 and b"Traceback" not in run.stderr
+                              and "Could not load config" in run.stdout.decode())
+
+            return True
+            
+        except Exception as e:
+            self.log_test("Report config", False, str(e))
+            return False
+        
+        finally:
+            if os.path.exists(config_file):
+                os.remove(config_file)
+    
+    def test_8_sharded_generation(self):
+        """Test 8: Verify N local shard processes cover every report exactly once"""
+        print("\n[TEST 8] Sharded Generation")
+        print("-" * 60)
+        
+        work_dir = tempfile.mkdtemp(prefix='qa_shards_')
+        try:
+            from report_config import load_config
+            from sharding import assign_shards, plan_units
+            
+            workbooks = []
+            for team in ["team_a", "team_b", "team_c"]:
+                path = os.path.join(work_dir, f"{team}.xlsx")
+                shutil.copy(self.excel_file, path)
+                workbooks.append(path)
+            output_dir = os.path.join(work_dir, "reports")
+            shard_count = 2
+            
+            units = plan_units(workbooks, load_config())
+            shards = assign_shards(units, shard_count)
+            assigned = sorted(u['name'] for shard in shards for u in shard)
+            self.log_test("Every unit assigned exactly once", assigned == sorted(u['name'] for u in units))
+            self.log_test("Assignment is deterministic",
+                          assign_shards(list(reversed(units)), shard_count) == shards)
+            loads = [sum(u['cost'] for u in shard) for shard in shards]
+            self.log_test("Shards are balanced by cost",
+                          max(loads) - min(loads) <= max(u['cost'] for u in units))
+            
+            # Run each shard as its own process against the shared output directory
+            command = [sys.executable, "generate_all.py", *workbooks, "--output-dir", output_dir]
+            processes = [
+                subprocess.Popen(command + ["--shard", f"{i}/{shard_count}", "--run-id", "run-1"],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                for i in range(1, shard_count + 1)
+            ]
+            exit_codes = [p.wait() for p in processes]
+            self.log_test("All shard processes succeeded", exit_codes == [0] * shard_count)
+            
+            merge = subprocess.run(command + ["--merge-shards", str(shard_count), "--run-id", "run-1"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            self.log_test("Merge succeeded", merge.returncode == 0, merge.stderr.decode()[-300:])
+            
+            reports = [f"{u['name']}_report.html" for u in units]
+            self.log_test("All reports written",
+                          all(os.path.exists(os.path.join(output_dir, r)) for r in reports))
+            with open(os.path.join(output_dir, "shards.html")) as f:
+                index_html = f.read()
+            self.log_test("Shard index links every report", all(f'href="{r}"' in index_html for r in reports))
+            with open(os.path.join(output_dir, "snapshot.json")) as f:
+                snapshot = json.load(f)
+            self.log_test("Shard snapshots merged", sorted(snapshot) == sorted(u['name'] for u in units))
+            self.log_test("Dashboard index built after merge",
+                          os.path.exists(os.path.join(output_dir, "index.html")))
+
+            # A shard that did not run this time must not be merged from last run's manifest
+            rerun = subprocess.run(command + ["--shard", f"1/{shard_count}", "--run-id", "run-2"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            stale = subprocess.run(command + ["--merge-shards", str(shard_count), "--run-id", "run-2"],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.log_test("Stale shard manifest reported missing",
+                          rerun.returncode == 0 and stale.returncode == 1
+                          and "1 shard(s) missing" in stale.stdout.decode())
+
+            missing_dir = os.path.join(work_dir, "never_run")
+            empty = subprocess.run(command[:-1] + [missing_dir, "--merge-shards", "2"],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.log_test("Merge without shard output exits 1",
+                          empty.returncode == 1 and b"Traceback" not in empty.stderr
+                          and "2 shard(s) missing" in empty.stdout.decode())
+
+            for bad_args in (["--merge-shards", "0"],
+                             ["--merge-shards", "2", "--shard", "1/2"],
+                             ["--compare", self.excel_file]):
+                bad = subprocess.run(command + bad_args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                self.log_test(f"Rejects {' '.join(bad_args)}", bad.returncode == 2, bad.stderr.decode()[-200:])
+
+            # Same file name in different folders: names come from the relative path
+            for team in ["a", "b"]:
+                os.makedirs(os.path.join(work_dir, "teams", team))
+                shutil.copy(self.excel_file, os.path.join(work_dir, "teams", team, "qa.xlsx"))
+            nested = [os.path.join(work_dir, "teams", team, "qa.xlsx") for team in ["a", "b"]]
+            names = [u['name'] for u in plan_units(nested, load_config())]
+            self.log_test("Same-named workbooks get distinct reports",
+                          names == ["a_qa_api", "a_qa_web", "b_qa_api", "b_qa_web"], str(names))
+            try:
+                plan_units([nested[0], nested[0]], load_config())
+                self.log_test("Duplicate workbook rejected", False)
+            except ValueError:
+                self.log_test("Duplicate workbook rejected", True)
+
+            # Unsharded runs never open workbooks to plan; a missing one is named, not a traceback
+            missing_book = os.path.join(work_dir, "nope.xlsx")
+            planned = plan_units([missing_book], load_config(), estimate_costs=False)
+            self.log_test("Unsharded planning reads no files", all(u['cost'] is None for u in planned))
+            for extra in ([], ["--shard", "1/2"]):
+                run = subprocess.run([sys.executable, "generate_all.py", missing_book, *workbooks,
+                                      "--output-dir", output_dir, *extra],
+                                     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                self.log_test(f"Missing workbook reported ({' '.join(extra) or 'unsharded'})",
+                              run.returncode == 1 and b"Traceback" not in run.stderr
+                              and f"Cannot read workbook {missing_book}" in run.stdout.decode())
+
+            return True
+            
+        except Exception as e:
+            self.log_test("Sharded generation", False, str(e))
+            return False
+        
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    def test_9_report_index(self):
+        """Test 9: Verify the dashboard index is rebuilt only from changed records"""
+        print("\n[TEST 9] Report Index")
+        print("-" * 60)
+        
+        output_dir = tempfile.mkdtemp(prefix='qa_index_')
+        try:
+            from report_config import load_config
+            from report_index import build_failed_record, build_index, build_record, write_record
+            
+            excel_data = read_excel_data("API Data")
+            api_config = load_config().for_report("api")
+            paths = []
+            for i in range(200):
+                record = build_record(f"team_{i:03d}_api", api_config, excel_data, f"team_{i:03d}.xlsx")
+                paths.append(write_record(output_dir, record))
+            
+            index_path = build_index(output_dir)
+            with open(index_path) as f:
+                index_html = f.read()
+            self.log_test("Index lists every report", index_html.count('_api_report.html"') == 200)
+            
+            # Corrupt an unchanged record but keep its mtime and size: an incremental build must not re-read it
+            stat = os.stat(paths[0])
+            with open(paths[0], 'w') as f:
+                f.write("x" * stat.st_size)
+            os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            changed = build_record("team_199_api", api_config, dict(excel_data, overall_pass_rate=12345), "team_199.xlsx")
+            write_record(output_dir, changed)
+            os.remove(paths[1])
+            
+            build_index(output_dir)
+            with open(index_path) as f:
+                index_html = f.read()
+            self.log_test("Changed record updated", "12345" in index_html)
+            self.log_test("Removed record dropped", "team_001_api_report.html" not in index_html)
+            self.log_test("Unchanged records served from cache", index_html.count('_api_report.html"') == 199)
+
+            # A failed report replaces its old record instead of leaving stale figures behind
+            write_record(output_dir, build_failed_record("team_002_api", api_config, "team_002.xlsx", "boom"))
+            build_index(output_dir)
+            with open(index_path) as f:
+                index_html = f.read()
+            self.log_test("Failed report shown as failed",
+                          'title="boom">Failed' in index_html and "1 failed" in index_html)
+            self.log_test("Failed report not linked", "team_002_api_report.html" not in index_html)
+
+            # A record cut short by a killed writer is listed as failed instead of breaking the build
+            with open(paths[3]) as f:
+                content = f.read()
+            with open(paths[3], 'w') as f:
+                f.write(content[:len(content) // 2])
+            build_index(output_dir)
+            with open(index_path) as f:
+                index_html = f.read()
+            self.log_test("Truncated record shown as failed",
+                          "team_003_api_report.html" not in index_html and "2 failed" in index_html)
+            write_record(output_dir, build_record("team_003_api", api_config, excel_data, "team_003.xlsx"))
+            build_index(output_dir)
+            with open(index_path) as f:
+                index_html = f.read()
+            self.log_test("Rewritten record recovers", "team_003_api_report.html" in index_html)
+            self.log_test("Records written atomically",
+                          not any(name.endswith('.tmp') for name in os.listdir(os.path.join(output_dir, "meta"))))
+
+            return True
+            
+        except Exception as e:
+            self.log_test("Report index", False, str(e))
+            return False
+        
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    
     def run_all_tests(self):
         """Run all tests"""
         print("=" * 60)
@@ -195,6 +700,12 @@ class TestSuite:
         results.append(self.test_1_report_generation())
         results.append(self.test_2_api_data_modifications())
         results.append(self.test_3_web_data_modifications())
+        results.append(self.test_4_compare_runs())
+        results.append(self.test_5_snapshot_export())
+        results.append(self.test_6_schema_validation())
+        results.append(self.test_7_report_config())
+        results.append(self.test_8_sharded_generation())
+        results.append(self.test_9_report_index())
         
         # Summary
         print("\n" + "=" * 60)
@@ -202,12 +713,14 @@ class TestSuite:
         print("=" * 60)
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r['passed'])
-        failed_tests = total_tests - passed_tests
+        passed_tests = sum(1 for r in self.test_results if r['passed'] is True)
+        skipped_tests = sum(1 for r in self.test_results if r['passed'] is None)
+        failed_tests = total_tests - passed_tests - skipped_tests
         
         print(f"\nTotal Tests: {total_tests}")
         print(f"Passed: {passed_tests}")
         print(f"Failed: {failed_tests}")
+        print(f"Skipped: {skipped_tests}")
         
         if failed_tests == 0:
             print("\n✓ ALL TESTS PASSED!")
@@ -215,7 +728,7 @@ class TestSuite:
             print(f"\n✗ {failed_tests} TEST(S) FAILED")
             print("\nFailed Tests:")
             for result in self.test_results:
-                if not result['passed']:
+                if result['passed'] is False:
                     print(f"  - {result['test']}: {result['message']}")
         
         print("=" * 60)
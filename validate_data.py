@@ -0,0 +1,150 @@
+"""
+Schema validation for the QA data workbook
+Checks every section of every sheet in one pass, before any report is rendered
+"""
+
+import numbers
+import pandas as pd
+
+# pandas row index i holds spreadsheet row i + 2 (the first row becomes the header)
+ROW_OFFSET = 2
+
+# Row ranges are pandas indices [start, stop) and are shared with read_excel_data.
+# Each column is (column index, label, type, required). 'unique' names the column
+# that keys the section's rows, which must not repeat within a sheet.
+SCHEMA = {
+    'lead': {
+        'rows': (3, 4),
+        'columns': [(1, 'Test Lead', 'text', True)],
+        'skip_empty': False,
+    },
+    'summary': {
+        'rows': (7, 11),
+        'columns': [
+            (0, 'Test Suite', 'text', True),
+            (1, 'Total Tests', 'count', True),
+            (2, 'Passed', 'count', True),
+            (3, 'Failed', 'count', True),
+            (4, 'Blocked', 'count', True),
+        ],
+        'skip_empty': True,
+        'unique': 0,
+    },
+    'defects': {
+        'rows': (16, 20),
+        'columns': [
+            (0, 'Priority', 'text', True),
+            (1, 'Count', 'count', True),
+        ],
+        'skip_empty': True,
+        'unique': 0,
+    },
+    'coverage': {
+        'rows': (23, 27),
+        'columns': [
+            (0, 'Area', 'text', True),
+            (1, 'Coverage %', 'percent', True),
+        ],
+        'skip_empty': True,
+        'unique': 0,
+    },
+    'risks': {
+        'rows': (29, 32),
+        'columns': [
+            (0, 'Issue ID', 'text', True),
+            (1, 'Description', 'text', True),
+            (2, 'Priority', 'text', False),
+            (3, 'Assigned Owner', 'text', False),
+            (4, 'Target Date', 'any', False),
+        ],
+        'skip_empty': True,
+        'unique': 0,
+    },
+}
+
+class SchemaError(Exception):
+    """Raised when a workbook does not match SCHEMA; carries every error found"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} validation error(s):\n" + "\n".join(f"  - {e}" for e in errors))
+
+def cell_ref(row_idx, col_idx):
+    """Spreadsheet coordinate (e.g. 'D9') of a pandas cell"""
+    return f"{chr(ord('A') + col_idx)}{row_idx + ROW_OFFSET}"
+
+def _cell(df, row_idx, col_idx):
+    if row_idx >= len(df) or col_idx >= len(df.columns):
+        return None
+    value = df.iloc[row_idx, col_idx]
+    return None if pd.isna(value) else value
+
+def _check_type(value, kind, label):
+    """Return an error message for a non-empty value, or None if it is valid"""
+    if kind in ('count', 'percent'):
+        if isinstance(value, bool) or not isinstance(value, numbers.Number):
+            return f"{label} must be a number, got {value!r}"
+        if kind == 'count' and value != int(value):
+            return f"{label} must be a whole number, got {value!r}"
+        if value < 0:
+            return f"{label} must not be negative, got {value!r}"
+        if kind == 'percent' and value > 100:
+            return f"{label} must be at most 100, got {value!r}"
+    elif kind == 'text' and isinstance(value, str) and not value.strip():
+        return f"{label} must not be blank"
+    return None
+
+def validate_sheet(df, sheet_name):
+    """Validate one sheet against SCHEMA and return a list of error messages"""
+    errors = []
+    for section, spec in SCHEMA.items():
+        seen = {}
+        for row_idx in range(*spec['rows']):
+            values = {col: _cell(df, row_idx, col) for col, _, _, _ in spec['columns']}
+
+            # Fully empty rows are unused slots, not errors
+            if spec['skip_empty'] and all(v is None for v in values.values()):
+                continue
+
+            # Rows are joined by this key later, so a repeat would silently replace the first
+            key_col = spec.get('unique')
+            if key_col is not None and values[key_col] is not None:
+                key = str(values[key_col]).strip()
+                if key in seen:
+                    label = next(l for c, l, _, _ in spec['columns'] if c == key_col)
+                    errors.append(
+                        f"{sheet_name}!{cell_ref(row_idx, key_col)}: {label} {key!r} "
+                        f"duplicates {cell_ref(seen[key], key_col)}"
+                    )
+                else:
+                    seen[key] = row_idx
+
+            row_ok = True
+            for col, label, kind, required in spec['columns']:
+                value = values[col]
+                if value is None:
+                    message = f"{label} is required" if required else None
+                else:
+                    message = _check_type(value, kind, label)
+                if message:
+                    errors.append(f"{sheet_name}!{cell_ref(row_idx, col)}: {message}")
+                    row_ok = False
+
+            if section == 'summary' and row_ok:
+                total, passed, failed, blocked = (values[c] for c in (1, 2, 3, 4))
+                if passed + failed + blocked > total:
+                    errors.append(
+                        f"{sheet_name}!{cell_ref(row_idx, 1)}: Passed + Failed + Blocked "
+                        f"({int(passed + failed + blocked)}) exceeds Total Tests ({int(total)})"
+                    )
+    return errors
+
+def validate_workbook(frames, sheet_names):
+    """Validate every expected sheet; frames maps sheet name to DataFrame"""
+    errors = []
+    for sheet_name in sheet_names:
+        if sheet_name not in frames:
+            errors.append(f"{sheet_name}: sheet not found")
+            continue
+        errors.extend(validate_sheet(frames[sheet_name], sheet_name))
+    return errors